@@ -38,6 +38,10 @@ except Exception as e:
     print("ERRO REAL AO IMPORTAR modulos.enviador_gzappy:", repr(e))
     raise
 
+from modulos.registro_log import obter_logger, mascarar_telefone
+
+log = obter_logger("app")
+
 # =========================
 # APP
 # =========================
@@ -328,8 +332,7 @@ def executar_cobranca():
         garantir_campos_padrao(c)
 
     mes_ref = mes_referencia_anterior()
-    print("Iniciando cobranca...")
-    print(f"Mes de referencia: {mes_ref}")
+    log.info("Iniciando cobranca (mes de referencia: %s)", mes_ref)
 
     # ====================================================
     # IDENTIFICAR QUAL CAMPO FOI PREENCHIDO
@@ -348,21 +351,23 @@ def executar_cobranca():
     # CASO ESPECIAL: MENSAGEM LIVRE (msg_livre)
     # ====================================================
     if campo_preenchido == "msg_livre":
-        print("Modo: Mensagem Livre (sem recibo, sem template, ignora status)")
+        log.info("Modo: Mensagem Livre (sem recibo, sem template, ignora status)")
         for cliente in clientes:
             if not cliente.get("selecao"):
                 continue
             telefone = cliente.get("telefone", "")
-            nome = cliente.get("nome_cliente", "")
             if not telefone:
-                print(f"Cliente {nome} sem telefone, pulando.")
+                log.warning("Cliente %s sem telefone, pulando.", cliente.get("id"))
                 continue
 
-            print(f"Enviando mensagem livre para: {nome}")
             mensagem_final = msg_digitada.strip()
-            ok = enviar_via_gzappy_api(telefone, mensagem_final, caminho_anexo_pdf=None)
+            ok = enviar_via_gzappy_api(
+                telefone, mensagem_final, caminho_anexo_pdf=None,
+                cliente_id=cliente.get("id"), etapa=campo_preenchido,
+            )
             if not ok:
-                print(f"FALHA ao enviar mensagem livre para: {nome} ({telefone})")
+                log.warning("FALHA ao enviar mensagem livre para cliente %s (%s)",
+                            cliente.get("id"), mascarar_telefone(telefone))
 
         flash("Mensagens livres enviadas!", "success")
         return redirect(url_for("index"))
@@ -411,7 +416,8 @@ def executar_cobranca():
 
         valor_final_str = float_para_str_br(valor_total)
 
-        print(f"Processando: {nome} (Mensalidade: {valor_mensalidade}, Pendência: {pendencia}, Total: {valor_final_str})")
+        log.debug("Processando cliente %s (Mensalidade: %s, Pendência: %s, Total: %s)",
+                  cliente.get("id"), valor_mensalidade, pendencia, valor_final_str)
 
         caminho_pdf = gerar_recibo_pdf(nome, valor_final_str)
 
@@ -426,11 +432,15 @@ def executar_cobranca():
         if msg_digitada:
             mensagem_final += "\n\n" + msg_digitada.strip()
 
-        print("Mensagem final enviada:", mensagem_final)
+        log.debug("Mensagem final: %s", mensagem_final)
 
-        ok = enviar_via_gzappy_api(telefone, mensagem_final, caminho_pdf)
+        ok = enviar_via_gzappy_api(
+            telefone, mensagem_final, caminho_pdf,
+            cliente_id=cliente.get("id"), etapa=campo_preenchido or "padrao",
+        )
         if not ok:
-            print(f"FALHA ao enviar para: {nome} ({telefone})")
+            log.warning("FALHA ao enviar para cliente %s (%s)",
+                        cliente.get("id"), mascarar_telefone(telefone))
 
     flash("Cobranças enviadas!", "success")
     return redirect(url_for("index"))
@@ -2,9 +2,12 @@ import requests
 import os
 import time
 from dotenv import load_dotenv
+from modulos.registro_log import obter_logger, mascarar_telefone
 
 load_dotenv()
 
+log = obter_logger("gzappy")
+
 GZAPPY_TOKEN = os.getenv("GZAPPY_TOKEN")
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
@@ -16,7 +19,7 @@ def upload_pdf_para_supabase(caminho_pdf, nome_arquivo):
     """Faz upload do PDF para Supabase e retorna URL publica"""
     try:
         if not SUPABASE_URL or not SUPABASE_KEY:
-            print("ERRO: Configuracao do Supabase nao encontrada")
+            log.error("Configuracao do Supabase nao encontrada")
             return None
         
         nome_base = os.path.splitext(nome_arquivo)[0]
@@ -37,27 +40,41 @@ def upload_pdf_para_supabase(caminho_pdf, nome_arquivo):
         
         if response.status_code == 200:
             public_url = f"{SUPABASE_URL}/storage/v1/object/public/recibos/{nome_unico}"
-            print(f"SUCESSO: PDF upload para {public_url}")
+            log.debug("PDF upload para %s", public_url)
             
             test_response = requests.get(public_url)
             if test_response.status_code == 200:
-                print("URL esta acessivel publicamente")
+                log.debug("URL esta acessivel publicamente")
                 return public_url
             else:
-                print(f"URL nao esta acessivel: {test_response.status_code}")
+                log.error("URL nao esta acessivel: %s", test_response.status_code)
                 return None
         else:
-            print(f"ERRO no upload: {response.status_code} - {response.text}")
+            log.error("Falha no upload: status=%s", response.status_code)
+            log.debug("Resposta do upload: %s", response.text)
             return None
             
     except Exception as e:
-        print(f"ERRO no upload para Supabase: {e}")
+        log.exception("Erro no upload para Supabase: %s", e)
         return None
 
-def enviar_via_gzappy_api(telefone_cliente, texto_mensagem, caminho_anexo_pdf=None):
+def _registrar_envio(cliente_id, etapa, telefone, inicio, status):
+    """Registro compacto de cada envio (cliente, etapa, latencia, status)"""
+    latencia_ms = (time.perf_counter() - inicio) * 1000
+    log.info(
+        "envio cliente=%s etapa=%s telefone=%s latencia_ms=%.0f status=%s",
+        cliente_id, etapa, mascarar_telefone(telefone), latencia_ms, status,
+    )
+
+
+def enviar_via_gzappy_api(telefone_cliente, texto_mensagem, caminho_anexo_pdf=None,
+                          cliente_id=None, etapa=None):
     
+    inicio = time.perf_counter()
+
     if not GZAPPY_TOKEN:
-        print("ERRO: GZAPPY_TOKEN nao encontrado")
+        log.error("GZAPPY_TOKEN nao encontrado")
+        _registrar_envio(cliente_id, etapa, telefone_cliente, inicio, "sem_token")
         return False
 
     telefone_formatado = telefone_cliente.replace('+', '')
@@ -73,7 +90,7 @@ def enviar_via_gzappy_api(telefone_cliente, texto_mensagem, caminho_anexo_pdf=No
             url_publica = upload_pdf_para_supabase(caminho_anexo_pdf, nome_arquivo)
             
             if not url_publica:
-                print("ERRO: Nao foi possivel fazer upload do PDF")
+                _registrar_envio(cliente_id, etapa, telefone_cliente, inicio, "falha_upload")
                 return False
             
             # FORMATO EXATO fornecido pelo suporte do Gzappy
@@ -84,8 +101,7 @@ def enviar_via_gzappy_api(telefone_cliente, texto_mensagem, caminho_anexo_pdf=No
                 'file_name': nome_arquivo
             }
             
-            print(f"Enviando PDF para {telefone_formatado}")
-            print(f"Payload enviado para Gzappy: {payload}")
+            log.debug("Payload enviado para Gzappy: %s", payload)
             response = requests.post(URL_MIDIA, headers=headers, json=payload)
 
         else:
@@ -94,19 +110,15 @@ def enviar_via_gzappy_api(telefone_cliente, texto_mensagem, caminho_anexo_pdf=No
                 'message': texto_mensagem,
             }
             
-            print(f"Enviando texto para {telefone_formatado}")
+            log.debug("Payload enviado para Gzappy: %s", payload)
             response = requests.post(URL_TEXTO, headers=headers, json=payload)
 
-        print(f"Status da resposta: {response.status_code}")
-        print(f"Resposta completa: {response.text}")
-        
-        if response.status_code == 200:
-            print("SUCESSO: Mensagem enviada")
-            return True
-        else:
-            print(f"FALHA: {response.status_code} - {response.text}")
-            return False
+        log.debug("Resposta completa: %s", response.text)
+        _registrar_envio(cliente_id, etapa, telefone_cliente, inicio, response.status_code)
+
+        return response.status_code == 200
 
     except Exception as e:
-        print(f"ERRO: {e}")
-        return False
\ No newline at end of file
+        log.exception("Erro no envio: %s", e)
+        _registrar_envio(cliente_id, etapa, telefone_cliente, inicio, "erro")
+        return False
@@ -0,0 +1,55 @@
+import os
+import atexit
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
+
+NOME_LOGGER = "cobrancas"
+FORMATO_LOG = "%(asctime)s %(levelname)s %(name)s %(message)s"
+
+_listener = None
+
+
+def mascarar_telefone(telefone):
+    """Mantem so os 4 ultimos digitos do telefone para nao vazar nos logs"""
+    digitos = "".join(ch for ch in str(telefone or "") if ch.isdigit())
+    if len(digitos) <= 4:
+        return "****"
+    return "*" * (len(digitos) - 4) + digitos[-4:]
+
+
+def configurar_logging(nivel=None):
+    """Configura o logger da aplicacao com handler em fila (nao bloqueante).
+
+    O nivel vem do parametro ou da variavel LOG_LEVEL (padrao INFO).
+    A escrita no console acontece numa thread separada (QueueListener).
+    """
+    global _listener
+
+    logger = logging.getLogger(NOME_LOGGER)
+    nivel = (nivel or os.getenv("LOG_LEVEL", "INFO")).upper()
+    logger.setLevel(getattr(logging, nivel, logging.INFO))
+
+    if _listener is not None:
+        return logger
+
+    fila = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter(FORMATO_LOG))
+
+    logger.addHandler(QueueHandler(fila))
+    logger.propagate = False
+
+    _listener = QueueListener(fila, console, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    return logger
+
+
+def obter_logger(nome=None):
+    """Retorna o logger da aplicacao (ou um filho dele), ja configurado"""
+    configurar_logging()
+    if nome:
+        return logging.getLogger(f"{NOME_LOGGER}.{nome}")
+    return logging.getLogger(NOME_LOGGER)